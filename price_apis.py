@@ -1,23 +1,217 @@
+import hashlib
 import json
 import logging
 import os
+import random
 import requests
 import sys
+import threading
+import time
 
+from concurrent.futures import ThreadPoolExecutor
 
-# Set up the logger
-logger = logging.getLogger()
-logger.setLevel(logging.DEBUG)
-handler = logging.StreamHandler(sys.stdout)
-handler.setLevel(logging.DEBUG)
-formatter = logging.Formatter(
-    '%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-handler.setFormatter(formatter)
-logger.addHandler(handler)
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+try:
+    import brotli
+except ImportError:
+    brotli = None
 
-API_CLASS_MAP = {'coinmarketcap': 'CoinMarketCap',
-                 'coingecko': 'CoinGecko', 'alphavantage': 'AlphaVantage', 'finnhub': 'FinnHub'}
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import redis
+except ImportError:
+    redis = None
+
+
+logger = logging.getLogger(__name__)
+
+
+def configure_logging():
+    """Attach a stdout handler to the root logger.
+
+    Called from the application entry point rather than at import time, so
+    importing this module doesn't duplicate handlers.
+    """
+    root = logging.getLogger()
+    root.setLevel(logging.DEBUG)
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setLevel(logging.DEBUG)
+    formatter = logging.Formatter(
+        '%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    handler.setFormatter(formatter)
+    root.addHandler(handler)
+
+
+# Snapshot the API keys at import time rather than reading os.environ in
+# each __init__ -- they can't change for the life of the process anyway
+_CMC_KEY = os.environ.get('CMC_API_KEY')
+_FH_KEY = os.environ.get('FINNHUB_API_KEY')
+_AV_KEY = os.environ.get('ALPHA_VANTAGE_API_KEY')
+
+
+# Share one Session across all APIs so connections are kept alive between
+# requests instead of paying a TCP + TLS handshake per call
+_SESSION = requests.Session()
+_SESSION.headers['Connection'] = 'keep-alive'
+# Brotli compresses the repetitive AlphaVantage JSON noticeably better than
+# gzip; only advertise it when urllib3 can actually decode it
+if brotli is not None:
+    _SESSION.headers['Accept-Encoding'] = 'gzip, deflate, br'
+_adapter = HTTPAdapter(
+    pool_connections=8,
+    pool_maxsize=16,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=1.0,
+        status_forcelist=(429, 500, 502, 503, 504),
+        # Honor upstream Retry-After headers, and hand back the final
+        # response instead of raising so we can fall back gracefully
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    ),
+)
+_SESSION.mount('https://', _adapter)
+_SESSION.mount('http://', _adapter)
+
+
+# Cache upstream responses in Redis when a REDIS_HOST is configured, so
+# polling faster than the data changes doesn't re-hit the APIs
+_REDIS = None
+if redis is not None and os.environ.get('REDIS_HOST'):
+    _REDIS = redis.Redis(
+        host=os.environ['REDIS_HOST'],
+        port=int(os.environ.get('REDIS_PORT', 6379)),
+        decode_responses=True,
+    )
+
+# Pre-bound format helpers for price rows, shared by every fetcher
+_fmt_price = '${:,.2f}'.format
+_fmt_pct = '{:.1f}%'.format
+
+# Per-endpoint cache TTLs in seconds
+_CRYPTO_TTL = 15
+_STOCK_TTL = 30
+_DAILY_TTL = 300
+
+# The last good payload per endpoint, served when an upstream throttles us
+_LAST_GOOD = {}
+
+
+_FINNHUB_API = 'https://finnhub.io/api/v1'
+
+
+def _build_finnhub_fetcher(stocks, api_key):
+    """Build a zero-argument FinnHub quote fetcher for a fixed stock list.
+
+    The stock list and API key never change after init, so the URL and the
+    per-stock params are baked into the closure as constants instead of
+    being rebuilt on every poll. The per-stock requests are fanned out over
+    a thread pool, so N stocks cost roughly one round trip.
+
+    Returns:
+        A callable returning a list of price data dicts, skipping stocks
+        with malformed responses.
+    """
+    url = f'{_FINNHUB_API}/quote'
+    quote_requests = tuple(
+        (stock, {'symbol': stock, 'token': api_key}) for stock in stocks)
+    max_workers = min(8, len(quote_requests))
+
+    def fetch_one(request):
+        stock, params = request
+        response = _cached_get(url, params=params, ttl=_STOCK_TTL)
+
+        try:
+            price_recent = response['c']
+            price_open = response['o']
+            change_24h = _fmt_pct(100 * ((price_recent / price_open) - 1))
+        except KeyError:
+            # TODO: Add error logging
+            return None
+
+        return dict(symbol=stock,
+                    price=_fmt_price(price_recent),
+                    change_24h=change_24h)
+
+    def fetch():
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return [result for result in executor.map(fetch_one, quote_requests)
+                    if result]
+
+    return fetch
+
+
+def _loads(payload):
+    """Decode a JSON payload, with orjson when it is available.
+
+    orjson parses directly from bytes in C, which matters for the large
+    AlphaVantage time-series responses.
+    """
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
+
+def _cached_get(url, params=None, headers=None, ttl=_STOCK_TTL):
+    """GET a JSON payload, caching the response body in Redis.
+
+    Args:
+        url (str): The URL to fetch.
+        params (dict): Query parameters for the request.
+        headers (dict): Headers for the request.
+        ttl (int): How long to cache the response, in seconds.
+
+    Returns:
+        The decoded JSON payload, or the last good payload for this endpoint
+        if the upstream is rate limiting us.
+    """
+    digest = hashlib.blake2b(
+        url.encode() + json.dumps(params or {}, sort_keys=True).encode(),
+        digest_size=16,
+    ).hexdigest()
+    key = f'px:{digest}'
+
+    if _REDIS is not None:
+        try:
+            raw = _REDIS.get(key)
+        except redis.RedisError:
+            raw = None
+        if raw:
+            return _loads(raw)
+
+    response = _SESSION.get(url, params=params, headers=headers)
+
+    # A 429 body is an error message, not price data -- keep showing the
+    # last good payload instead and let the backoff window pass
+    if response.status_code == 429:
+        logger.warning(
+            'Rate limited by %s, Retry-After=%s',
+            url, response.headers.get('Retry-After'))
+        return _LAST_GOOD.get(key, {})
+
+    if _REDIS is not None and response.ok:
+        try:
+            # Jitter the expiry so cached entries don't all lapse at once
+            _REDIS.set(key, response.text, ex=ttl + random.randint(0, ttl // 5))
+        except redis.RedisError:
+            pass
+
+    payload = _loads(response.content)
+    if response.ok:
+        _LAST_GOOD[key] = payload
+
+    return payload
 
 
 def get_api_cls(api_name):
@@ -26,19 +220,32 @@ def get_api_cls(api_name):
     Args:
         api_name (str): The name of the API to use.
     """
-    if api_name not in API_CLASS_MAP:
+    try:
+        return API_CLASSES[api_name]
+    except KeyError:
         raise RuntimeError(f'"{api_name}" api is not implemented.')
-    return getattr(sys.modules[__name__], API_CLASS_MAP[api_name])
 
 
 class PriceAPI:
     """The base class for Price API"""
 
+    __slots__ = ('symbols', 'stocks', 'currency', '_symbols_list', '_stocks_list')
+
+    # How often a poller should refresh this API, in seconds
+    POLL_INTERVAL = 10
+
+    # The set of currencies the API can quote prices in
+    SUPPORTED_CURRENCIES = frozenset()
+
     def __init__(self, symbols, currency, stocks):
         self.symbols = symbols
         self.stocks = stocks
         self.currency = currency
 
+        # Split the configured lists once -- they never change after init
+        self._symbols_list = tuple(symbols.split(','))
+        self._stocks_list = tuple(stocks.split(','))
+
         self.validate_currency(currency)
 
     def fetch_price_data(self):
@@ -51,54 +258,54 @@ class PriceAPI:
         """
         raise NotImplementedError
 
-    @property
-    def supported_currencies(self):
-        raise NotImplementedError
-
     def validate_currency(self, currency):
-        if currency not in self.supported_currencies:
+        if currency not in self.SUPPORTED_CURRENCIES:
             raise ValueError(
-                f"CURRENCY={currency} is not supported. Options are: {self.supported_currencies}."
+                f"CURRENCY={currency} is not supported. Options are: {sorted(self.SUPPORTED_CURRENCIES)}."
             )
 
 
 class CoinMarketCap(PriceAPI):
+    __slots__ = ('api_key', '_headers', '_quote_params')
+
     API = 'https://pro-api.coinmarketcap.com'
+    QUOTE_URL = API + '/v1/cryptocurrency/quotes/latest'
+    SUPPORTED_CURRENCIES = frozenset({'usd'})
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
         # Confirm an API key is present
-        try:
-            self.api_key = os.environ['CMC_API_KEY']
-        except KeyError:
+        if _CMC_KEY is None:
             raise RuntimeError('CMC_API_KEY environment variable must be set.')
+        self.api_key = _CMC_KEY
 
-    @property
-    def supported_currencies(self):
-        return ["usd"]
+        # Build the auth header and query params once so they aren't
+        # reconstructed per call
+        self._headers = {'X-CMC_PRO_API_KEY': self.api_key}
+        self._quote_params = {'symbol': self.symbols}
 
     def fetch_price_data(self):
         """Fetch new price data from the CoinMarketCap API"""
         logger.info('`fetch_price_data` called.')
 
-        response = requests.get(
-            f'{self.API}/v1/cryptocurrency/quotes/latest',
-            params={'symbol': self.symbols},
-            headers={'X-CMC_PRO_API_KEY': self.api_key},
-        )
-        price_data = []
-
         try:
-            items = response.json().get('data', {}).items()
-        except json.JSONDecodeError:
-            logger.error(f'JSON decode error: {response.text}')
+            response = _cached_get(
+                self.QUOTE_URL,
+                params=self._quote_params,
+                headers=self._headers,
+                ttl=_CRYPTO_TTL,
+            )
+        except json.JSONDecodeError as error:
+            logger.error('JSON decode error: %s', error.doc)
             return
 
-        for symbol, data in items:
+        price_data = []
+
+        for symbol, data in response.get('data', {}).items():
             try:
-                price = f"${data['quote']['USD']['price']:,.2f}"
-                change_24h = f"{data['quote']['USD']['percent_change_24h']:.1f}%"
+                price = _fmt_price(data['quote']['USD']['price'])
+                change_24h = _fmt_pct(data['quote']['USD']['percent_change_24h'])
             except KeyError:
                 # TODO: Add error logging
                 continue
@@ -109,16 +316,25 @@ class CoinMarketCap(PriceAPI):
 
 
 class CoinGecko(PriceAPI):
+    __slots__ = ('api_key', 'symbol_map', '_ids_param', '_price_params',
+                 '_fetch_quotes')
+
     CG_API = 'https://api.coingecko.com/api/v3'
-    FH_API = 'https://finnhub.io/api/v1/'
+    PRICE_URL = CG_API + '/simple/price'
+    SUPPORTED_CURRENCIES = frozenset({'usd'})
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
-        # Fetch the coin list and cache data for our symbols
-        # response = requests.get(f'{self.CG_API}/coins/list')
+        # Confirm an API key is present
+        if _FH_KEY is None:
+            raise RuntimeError(
+                'FINNHUB_API_KEY environment variable must be set.')
+        self.api_key = _FH_KEY
 
-        # The CoinGecko API uses ids to fetch price data
+        # The CoinGecko API uses ids to fetch price data. Start from a static
+        # map of common coins, then resolve any other requested symbols from
+        # the /coins/list endpoint so they all fit in one batched request.
         symbol_map = {
             'bitcoin': 'BTC',
             'ethereum': 'ETH',
@@ -128,133 +344,214 @@ class CoinGecko(PriceAPI):
             'bitcoin-cash-sv': 'BSV',
         }
 
-        self.symbol_map = symbol_map
+        missing = {s.strip().upper() for s in self._symbols_list}
+        missing -= set(symbol_map.values())
+        if missing:
+            try:
+                coin_list = _loads(_SESSION.get(f'{self.CG_API}/coins/list').content)
+            except (requests.RequestException, ValueError):
+                logger.error('Failed to fetch the CoinGecko coin list.')
+                coin_list = []
+            for coin in coin_list:
+                symbol = coin.get('symbol', '').upper()
+                if symbol in missing:
+                    symbol_map[coin['id']] = symbol
+                    missing.discard(symbol)
 
-        # Confirm an API key is present
-        try:
-            self.api_key = os.environ['FINNHUB_API_KEY']
-        except KeyError:
-            raise RuntimeError(
-                'FINNHUB_API_KEY environment variable must be set.')
+        self.symbol_map = symbol_map
+        self._ids_param = ','.join(symbol_map.keys())
 
-    @property
-    def supported_currencies(self):
-        return ["usd"]
+        # Bake the static request params and the FinnHub quote fetcher once
+        self._price_params = {
+            'ids': self._ids_param,
+            'vs_currencies': self.currency,
+            'include_24hr_change': 'true',
+        }
+        self._fetch_quotes = _build_finnhub_fetcher(
+            self._stocks_list, self.api_key)
 
     def fetch_price_data(self):
         """Fetch new price data from the CoinGecko and FinnHub API"""
         logger.info('`fetch_price_data` called.')
-        logger.info(f'Fetching data for {self.symbol_map} and {self.stocks}.')
-
-        # Make the API request
-        CG_response = requests.get(
-            f'{self.CG_API}/simple/price',
-            params={
-                'ids': ','.join(list(self.symbol_map.keys())),
-                'vs_currencies': self.currency,
-                'include_24hr_change': 'true',
-            },
-        ).json()
+        logger.info('Fetching data for %s and %s.', self.symbol_map, self.stocks)
+
+        # Fan every request out at once -- the CoinGecko call and the
+        # per-stock FinnHub quotes -- so total latency is roughly the
+        # slowest single request instead of the sum of all of them
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            cg_future = executor.submit(
+                _cached_get,
+                self.PRICE_URL,
+                params=self._price_params,
+                ttl=_CRYPTO_TTL,
+            )
+            quotes_future = executor.submit(self._fetch_quotes)
+            CG_response = cg_future.result()
+            stock_data = quotes_future.result()
 
         price_data = []
 
-        for coin_id, data in CG_response.items():
+        # Iterate the ids we asked for rather than whatever came back, so
+        # unrequested keys in the response can't trip us up
+        for coin_id, symbol in self.symbol_map.items():
+            data = CG_response.get(coin_id)
+            if not data:
+                continue
+
             try:
-                price = f"${data['usd']:,.2f}"
-                change_24h = f"{data['usd_24h_change']:.1f}%"
+                price = _fmt_price(data['usd'])
+                change_24h = _fmt_pct(data['usd_24h_change'])
             except KeyError:
                 continue
 
             price_data.append(
-                dict(symbol=self.symbol_map[coin_id],
-                     price=price, change_24h=change_24h)
-            )
-
-        for stock in self.stocks.split(','):
-            response = requests.get(
-                f'{self.FH_API}/quote',
-                params={'symbol': stock,
-                        'token': self.api_key},
-            ).json()
+                dict(symbol=symbol, price=price, change_24h=change_24h))
 
-            try:
-                price_recent = response['c']
-                price_open = response['o']
-                change_24h = f"{100*((price_recent/price_open)-1):.1f}%"
-                price_data.append(
-                    dict(symbol=stock,
-                         price=f"${price_recent:,.2f}",
-                         change_24h=change_24h))
-            except KeyError:
-                # TODO: Add error logging
-                continue
+        price_data.extend(stock_data)
 
-        logger.info(price_data)
+        logger.info('price_data=%r', price_data)
 
         return price_data
 
 
 class FinnHub(PriceAPI):
-    API = 'https://finnhub.io/api/v1/'
+    __slots__ = ('api_key', '_fetch_quotes')
+
+    API = _FINNHUB_API
+    SUPPORTED_CURRENCIES = frozenset({'usd'})
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
         # Confirm an API key is present
-        try:
-            self.api_key = os.environ['FINNHUB_API_KEY']
-        except KeyError:
+        if _FH_KEY is None:
             raise RuntimeError(
                 'FINNHUB_API_KEY environment variable must be set.')
+        self.api_key = _FH_KEY
 
-    @property
-    def supported_currencies(self):
-        return ["usd"]
+        # Bake the quote fetcher once for the fixed stock list
+        self._fetch_quotes = _build_finnhub_fetcher(
+            self._stocks_list, self.api_key)
 
     def fetch_price_data(self):
         """Fetch new price data from the FinnHub API"""
         logger.info('`fetch_price_data` called.')
 
-        price_data = []
-
-        for stock in self.stocks.split(','):
-            response = requests.get(
-                f'{self.API}/quote',
-                params={'symbol': stock,
-                        'token': self.api_key},
-            ).json()
-
-            try:
-                price_recent = response['c']
-                price_open = response['o']
-                change_24h = f"{100*((price_recent/price_open)-1):.1f}%"
-                price_data.append(
-                    dict(symbol=stock,
-                         price=f"${price_recent:,.2f}",
-                         change_24h=change_24h))
-            except KeyError:
-                # TODO: Add error logging
-                continue
-
-        return price_data
+        return self._fetch_quotes()
 
 
 class AlphaVantage(PriceAPI):
+    __slots__ = ('api_key', '_stock_requests', '_fx_requests')
+
     API = 'https://www.alphavantage.co'
+    QUOTE_URL = API + '/query?function=GLOBAL_QUOTE'
+    FX_URL = API + '/query?function=CURRENCY_EXCHANGE_RATE'
+    DAILY_URL = API + '/query?function=DIGITAL_CURRENCY_DAILY'
+    SUPPORTED_CURRENCIES = frozenset({'usd'})
+
+    # The AlphaVantage free tier allows 5 requests/minute, so poll slowly
+    POLL_INTERVAL = 60
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
         # Confirm an API key is present
-        try:
-            self.api_key = os.environ['ALPHA_VANTAGE_API_KEY']
-        except KeyError:
+        if _AV_KEY is None:
             raise RuntimeError(
                 'ALPHA_VANTAGE_API_KEY environment variable must be set.')
+        self.api_key = _AV_KEY
+
+        # Bake the static request params once -- the symbol and stock lists
+        # are fixed for the life of the process
+        self._stock_requests = tuple(
+            (stock, {'symbol': stock, 'apikey': self.api_key})
+            for stock in self._stocks_list)
+        self._fx_requests = tuple(
+            (symbol,
+             {'from_currency': symbol,
+              'to_currency': 'USD',
+              'apikey': self.api_key},
+             {'symbol': symbol,
+              'market': 'USD',
+              'apikey': self.api_key})
+            for symbol in self._symbols_list)
+
+    def _fetch_one_stock(self, request):
+        """Fetch the latest quote for a single stock.
+
+        Uses the GLOBAL_QUOTE function, which returns a single row with the
+        latest price and change instead of a full intraday time series.
+
+        Args:
+            request: A (stock, params) pair from self._stock_requests.
 
-    @property
-    def supported_currencies(self):
-        return ["usd"]
+        Returns:
+            A price data dict for the stock, or None if the response is missing
+            the expected fields.
+        """
+        stock, params = request
+        response = _cached_get(self.QUOTE_URL, params=params, ttl=_STOCK_TTL)
+
+        try:
+            quote = response['Global Quote']
+            price_recent = float(quote['05. price'])
+            change_24h = _fmt_pct(float(quote['10. change percent'].rstrip('%')))
+        except (KeyError, ValueError):
+            # TODO: Add error logging
+            return None
+
+        return dict(symbol=stock,
+                    price=_fmt_price(price_recent),
+                    change_24h=change_24h)
+
+    def _fetch_daily_open(self, symbol, params):
+        """Fetch the most recent daily open price for a crypto symbol.
+
+        The DIGITAL_CURRENCY_DAILY response carries the symbol's full daily
+        history but only the latest bar is needed, so stream-parse it with
+        ijson and stop at the first (most recent) entry instead of
+        materializing the whole payload. The extracted value is cached in
+        Redis in place of the multi-hundred-KB body.
+
+        Returns:
+            The open price in USD as a string, or None if unavailable.
+        """
+        if ijson is None:
+            response = _cached_get(self.DAILY_URL, params=params, ttl=_DAILY_TTL)
+            try:
+                last_refreshed = response['Meta Data']['6. Last Refreshed'][:10]
+                return response['Time Series (Digital Currency Daily)'][
+                    last_refreshed]['1a. open (USD)']
+            except KeyError:
+                return None
+
+        key = f'px:av-daily-open:{symbol}'
+        if _REDIS is not None:
+            try:
+                cached = _REDIS.get(key)
+            except redis.RedisError:
+                cached = None
+            if cached:
+                return cached
+
+        with _SESSION.get(self.DAILY_URL, params=params, stream=True) as response:
+            # Decode the transfer encoding so ijson sees plain JSON bytes
+            response.raw.decode_content = True
+            try:
+                _, bar = next(ijson.kvitems(
+                    response.raw, 'Time Series (Digital Currency Daily)'))
+                open_usd = bar['1a. open (USD)']
+            except (StopIteration, KeyError, ijson.JSONError):
+                return None
+
+        if _REDIS is not None:
+            try:
+                _REDIS.set(key, open_usd,
+                           ex=_DAILY_TTL + random.randint(0, _DAILY_TTL // 5))
+            except redis.RedisError:
+                pass
+
+        return open_usd
 
     def fetch_price_data(self):
         """Fetch new price data from the Alpha Vantage API"""
@@ -262,56 +559,92 @@ class AlphaVantage(PriceAPI):
 
         price_data = []
 
-        for stock in self.stocks.split(','):
-            response = requests.get(
-                f'{self.API}/query?function=TIME_SERIES_INTRADAY',
-                params={'symbol': stock,
-                        'interval': '30min',
-                        'outputsize': 'full',
-                        'apikey': self.api_key},
-            ).json()
+        # Fan all of the requests out over a thread pool. Each crypto symbol
+        # needs two requests, so submit those as separate futures too.
+        max_workers = min(8, len(self._stock_requests) + 2 * len(self._fx_requests))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            stock_results = executor.map(self._fetch_one_stock, self._stock_requests)
+
+            symbol_futures = [
+                (symbol,
+                 executor.submit(
+                     _cached_get, self.FX_URL, params=fx_params, ttl=_CRYPTO_TTL),
+                 executor.submit(self._fetch_daily_open, symbol, daily_params))
+                for symbol, fx_params, daily_params in self._fx_requests
+            ]
+
+            price_data.extend(result for result in stock_results if result)
+
+            for symbol, future_current, future_daily in symbol_futures:
+                response_current = future_current.result()
+                price_open = future_daily.result()
+
+                if price_open is None:
+                    continue
+
+                try:
+                    price_recent = response_current['Realtime Currency Exchange Rate']['5. Exchange Rate']
+                    change_24h = _fmt_pct(100 * ((float(price_recent) / float(price_open)) - 1))
+                    price_data.append(
+                        dict(symbol=symbol,
+                             price=_fmt_price(float(price_recent)),
+                             change_24h=change_24h))
+                except KeyError:
+                    # TODO: Add error logging
+                    continue
 
-            try:
-                last_refreshed = response['Meta Data']['3. Last Refreshed']
-                price_recent = response['Time Series (30min)'][last_refreshed]['1. open']
-                price_open = response['Time Series (30min)'].get(
-                    f"{last_refreshed[:10]} 09:30:00", {}).get('1. open', price_recent)
-                change_24h = f"{100*((float(price_recent)/float(price_open))-1):.1f}%"
-                price_data.append(
-                    dict(symbol=stock,
-                         price=f"${float(price_recent):,.2f}",
-                         change_24h=change_24h))
-            except KeyError:
-                # TODO: Add error logging
-                continue
+        return price_data
 
-        for symbol in self.symbols.split(','):
-            response_current = requests.get(
-                f'{self.API}/query?function=CURRENCY_EXCHANGE_RATE',
-                params={'from_currency': symbol,
-                        'to_currency': 'USD',
-                        'apikey': self.api_key},
-            ).json()
-
-            response_daily = requests.get(
-                f'{self.API}/query?function=DIGITAL_CURRENCY_DAILY',
-                params={'symbol': symbol,
-                        'market': 'USD',
-                        'apikey': self.api_key},
-            ).json()
 
-            try:
-                last_refreshed = response_daily['Meta Data']['6. Last Refreshed'][:10]
-                price_recent = response_current['Realtime Currency Exchange Rate']['5. Exchange Rate']
-                price_open = response_daily['Time Series (Digital Currency Daily)'][
-                    last_refreshed]['1a. open (USD)']
-                change_24h = f"{100*((float(price_recent)/float(price_open))-1):.1f}%"
-                price_data.append(
-                    dict(symbol=symbol,
-                         price=f"${float(price_recent):,.2f}",
-                         change_24h=change_24h))
-            except KeyError:
-                # TODO: Add error logging
-                continue
+# Map API names directly to their classes, now that they're all defined
+API_CLASSES = {
+    'coinmarketcap': CoinMarketCap,
+    'coingecko': CoinGecko,
+    'alphavantage': AlphaVantage,
+    'finnhub': FinnHub,
+}
 
-        return price_data
+
+class PriceAPIPoller:
+    """Poll a PriceAPI in the background and keep the latest snapshot.
+
+    A daemon thread refreshes the price data on the API's cadence so that
+    consumers (the render loop) can read `snapshot()` without ever blocking
+    on the network.
+    """
+
+    def __init__(self, api, poll_interval=None):
+        self.api = api
+        self.poll_interval = poll_interval or api.POLL_INTERVAL
+        self._latest = None
+        self._thread = None
+
+    def start(self):
+        """Fetch once synchronously, then keep polling in a daemon thread.
+
+        Returns:
+            The poller, so it can be chained off the constructor.
+        """
+        self._poll_once()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def snapshot(self):
+        """Return the most recently fetched price data."""
+        return self._latest or []
+
+    def _poll_once(self):
+        try:
+            data = self.api.fetch_price_data()
+        except Exception:
+            logger.exception('Price data fetch failed.')
+            return
+        # Keep the last good snapshot if a fetch comes back empty
+        if data:
+            self._latest = data
+
+    def _run(self):
+        while True:
+            time.sleep(self.poll_interval)
+            self._poll_once()
@@ -6,7 +6,7 @@ import time
 
 from frame import Frame
 from rgbmatrix import graphics
-from price_apis import get_api_cls, logger
+from price_apis import configure_logging, get_api_cls, PriceAPIPoller
 
 
 class Ticker(Frame):
@@ -16,18 +16,21 @@ class Ticker(Frame):
         Gather the users settings from environment variables, then initialize the
         LED Panel Frame class.
         """
-        # initialize variables used for price data cache
-        self._cached_price_data = None
-        self._last_fetch_time = 0
-
         # Set up the API
         api_cls = get_api_cls(os.environ.get('API', 'coingecko'))
         self.api = api_cls(symbols=self.get_symbols(), currency=self.get_currency(), stocks=self.get_stocks())
 
         # Get user settings
-        self.refresh_rate = int(os.environ.get('REFRESH_RATE', 900))  # 900s or 15m
+        refresh_rate = os.environ.get('REFRESH_RATE')
         self.sleep = int(os.environ.get('SLEEP', 1))  # 1s
 
+        # Poll for price data in the background so the render loop never
+        # blocks on the network. REFRESH_RATE overrides the API's cadence.
+        self.poller = PriceAPIPoller(
+            self.api,
+            poll_interval=int(refresh_rate) if refresh_rate else None,
+        ).start()
+
         super().__init__(*args, **kwargs)
 
     def get_symbols(self):
@@ -53,30 +56,15 @@ class Ticker(Frame):
 
     @property
     def price_data(self):
-        """Price data for the requested assets, update automatically.
+        """Price data for the requested assets, updated automatically.
 
-        This function will return a cached copy of the asset prices unless its time to
-        fetch fresh data. We'll use the REFRESH_RATE environment variable to determine
-        if it's time to refresh data.
+        The background poller refreshes the data on its own cadence, so this
+        always returns the latest snapshot without blocking on the network.
 
         Returns:
-            Updated price data. See self.api.fetch_price_data.
+            The latest price data. See self.api.fetch_price_data.
         """
-        # Determine if the cache is stale
-        cache_is_stale = (time.time() - self._last_fetch_time) > self.refresh_rate
-
-        # See if we should return the cached price data
-        if self._cached_price_data and not cache_is_stale:
-            logger.info('Using cached price data.')
-            return self._cached_price_data
-
-        # Otherwise fetch new data and set the _last_fetch_time
-        price_data = self.api.fetch_price_data()
-        logger.info(f'Fetched new prices, {price_data}')
-        self._last_fetch_time = time.time()
-        self._cached_price_data = price_data
-
-        return price_data
+        return self.poller.snapshot()
 
     def get_ticker_canvas(self, asset):
         """Build the ticker canvas given an asset
@@ -165,4 +153,5 @@ class Ticker(Frame):
 
 
 if __name__ == '__main__':
+    configure_logging()
     Ticker().process()